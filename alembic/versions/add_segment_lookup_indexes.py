@@ -0,0 +1,45 @@
+"""add segment and speaker mapping lookup indexes
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "f6a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index segment lookups by transcript and mapping lookups by profile.
+
+    Segment had no index on transcript_id, so per-speaker aggregation and
+    ordered playback scanned the whole table; speaker_profile_id had no
+    index, so profile -> mappings reverse lookups scanned speaker_mapping.
+    """
+    op.create_index(
+        "ix_segment_tx_speaker",
+        "segment",
+        ["transcript_id", "speaker_id_in_transcript"],
+    )
+    op.create_index("ix_segment_tx_start", "segment", ["transcript_id", "start"])
+    op.create_index(
+        "ix_speaker_mapping_speaker_profile_id",
+        "speaker_mapping",
+        ["speaker_profile_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the segment and speaker mapping lookup indexes."""
+    op.drop_index(
+        "ix_speaker_mapping_speaker_profile_id", table_name="speaker_mapping"
+    )
+    op.drop_index("ix_segment_tx_start", table_name="segment")
+    op.drop_index("ix_segment_tx_speaker", table_name="segment")
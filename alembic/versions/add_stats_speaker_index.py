@@ -0,0 +1,51 @@
+"""add speaker index on transcript_speaker_stats
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, Sequence[str], None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index transcript_speaker_stats by speaker_id_in_transcript.
+
+    The composite pkey leads with transcript_id, so per-speaker aggregation
+    across transcripts cannot use it and falls back to sequential scans. On
+    Postgres the index INCLUDEs the core metric columns for index-only scans
+    and is built CONCURRENTLY to avoid blocking writes.
+    """
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                sa.text(
+                    "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                    "ix_transcript_speaker_stats_speaker "
+                    "ON transcript_speaker_stats (speaker_id_in_transcript) "
+                    "INCLUDE (total_seconds, segment_count, word_count, wpm)"
+                )
+            )
+    else:
+        op.create_index(
+            "ix_transcript_speaker_stats_speaker",
+            "transcript_speaker_stats",
+            ["speaker_id_in_transcript"],
+        )
+
+
+def downgrade() -> None:
+    """Drop the speaker index."""
+    op.drop_index(
+        "ix_transcript_speaker_stats_speaker",
+        table_name="transcript_speaker_stats",
+    )
@@ -0,0 +1,31 @@
+"""add keyset pagination index on transcript
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add (created_at DESC, id) index backing transcript keyset pagination."""
+    op.create_index(
+        "ix_transcript_created_at_id",
+        "transcript",
+        [sa.text("created_at DESC"), "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    op.drop_index("ix_transcript_created_at_id", table_name="transcript")
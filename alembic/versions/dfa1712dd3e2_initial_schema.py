@@ -119,8 +119,7 @@ def upgrade() -> None:
     sa.Column('share_speaking_time', sa.Float(), nullable=True),
     sa.Column('share_words', sa.Float(), nullable=True),
     sa.ForeignKeyConstraint(['transcript_id'], ['transcript.id'], ondelete='CASCADE'),
-    sa.PrimaryKeyConstraint('transcript_id', 'speaker_id_in_transcript'),
-    sa.UniqueConstraint('transcript_id', 'speaker_id_in_transcript', name='uq_transcript_speaker_stats')
+    sa.PrimaryKeyConstraint('transcript_id', 'speaker_id_in_transcript')
     )
     # ### end Alembic commands ###
 
@@ -0,0 +1,44 @@
+"""drop duplicate unique constraint on transcript_speaker_stats
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, Sequence[str], None] = "b2c3d4e5f6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop uq_transcript_speaker_stats; the composite pkey already enforces it.
+
+    The extra unique constraint built a second btree identical to the primary
+    key index, doubling index maintenance on every insert for no benefit.
+
+    Fresh databases build from the initial migration, which no longer
+    declares the constraint, so only drop it where it actually exists.
+    """
+    constraints = sa.inspect(op.get_bind()).get_unique_constraints(
+        "transcript_speaker_stats"
+    )
+    if not any(c["name"] == "uq_transcript_speaker_stats" for c in constraints):
+        return
+    with op.batch_alter_table("transcript_speaker_stats") as batch_op:
+        batch_op.drop_constraint("uq_transcript_speaker_stats", type_="unique")
+
+
+def downgrade() -> None:
+    """Recreate the redundant unique constraint."""
+    with op.batch_alter_table("transcript_speaker_stats") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_transcript_speaker_stats",
+            ["transcript_id", "speaker_id_in_transcript"],
+        )
@@ -0,0 +1,103 @@
+"""native uuid columns on postgres
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, Sequence[str], None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs storing UUIDs as VARCHAR(36).
+_UUID_COLUMNS: list[tuple[str, str]] = [
+    ("content_group", "id"),
+    ("speaker_profile", "id"),
+    ("speaker_profile", "group_id"),
+    ("transcript", "id"),
+    ("transcript", "group_id"),
+    ("segment", "id"),
+    ("segment", "transcript_id"),
+    ("speaker_mapping", "transcript_id"),
+    ("speaker_mapping", "speaker_profile_id"),
+    ("transcript_speaker_stats", "transcript_id"),
+    ("transcript_llm_analysis", "id"),
+    ("transcript_llm_analysis", "transcript_id"),
+]
+
+# Foreign keys between UUID columns (constraint, table, column, referred table).
+_UUID_FOREIGN_KEYS: list[tuple[str, str, str, str]] = [
+    ("speaker_profile_group_id_fkey", "speaker_profile", "group_id", "content_group"),
+    ("transcript_group_id_fkey", "transcript", "group_id", "content_group"),
+    ("segment_transcript_id_fkey", "segment", "transcript_id", "transcript"),
+    ("speaker_mapping_transcript_id_fkey", "speaker_mapping", "transcript_id", "transcript"),
+    (
+        "speaker_mapping_speaker_profile_id_fkey",
+        "speaker_mapping",
+        "speaker_profile_id",
+        "speaker_profile",
+    ),
+    (
+        "transcript_speaker_stats_transcript_id_fkey",
+        "transcript_speaker_stats",
+        "transcript_id",
+        "transcript",
+    ),
+    (
+        "transcript_llm_analysis_transcript_id_fkey",
+        "transcript_llm_analysis",
+        "transcript_id",
+        "transcript",
+    ),
+]
+
+
+def _alter_column_types(target_type: str, using_cast: str) -> None:
+    """Alter all UUID columns to target_type, one ALTER TABLE per table."""
+    clauses: dict[str, list[str]] = {}
+    for table, column in _UUID_COLUMNS:
+        clauses.setdefault(table, []).append(
+            f"ALTER COLUMN {column} TYPE {target_type} USING {column}::{using_cast}"
+        )
+    for table, cols in clauses.items():
+        op.execute(sa.text(f"ALTER TABLE {table} " + ", ".join(cols)))
+
+
+def upgrade() -> None:
+    """Convert VARCHAR(36) UUID columns to native uuid on Postgres.
+
+    Native uuid stores 16 bytes instead of 36, shrinking the heap and every
+    index keyed on these columns. SQLite keeps String(36); this revision is a
+    no-op there. FKs between the columns must be dropped around the type
+    change and recreated afterwards.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name, table, _column, _referred in _UUID_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+    _alter_column_types("uuid", "uuid")
+    for name, table, column, referred in _UUID_FOREIGN_KEYS:
+        op.create_foreign_key(
+            name, table, referred, [column], ["id"], ondelete="CASCADE"
+        )
+
+
+def downgrade() -> None:
+    """Convert native uuid columns back to VARCHAR(36) on Postgres."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name, table, _column, _referred in _UUID_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+    _alter_column_types("VARCHAR(36)", "text")
+    for name, table, column, referred in _UUID_FOREIGN_KEYS:
+        op.create_foreign_key(
+            name, table, referred, [column], ["id"], ondelete="CASCADE"
+        )
@@ -0,0 +1,119 @@
+"""replace segment uuid pk with autoincrement bigint
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SEGMENT_INDEXES = (
+    ("ix_segment_tx_speaker", ["transcript_id", "speaker_id_in_transcript"]),
+    ("ix_segment_tx_start", ["transcript_id", "start"]),
+)
+
+
+def _recreate_segment_indexes() -> None:
+    for name, columns in _SEGMENT_INDEXES:
+        op.create_index(name, "segment", columns)
+
+
+def upgrade() -> None:
+    """Swap the segment UUID PK for an autoincrement BIGINT.
+
+    Segments are never referenced externally, only through their transcript,
+    so the 36-byte random PK just bloated the B-tree and caused random leaf
+    insertions. Sequential ints append instead. Old ids are discarded; the
+    column is a pure surrogate.
+    """
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(sa.text("ALTER TABLE segment DROP CONSTRAINT segment_pkey"))
+        op.drop_column("segment", "id")
+        op.execute(
+            sa.text("ALTER TABLE segment ADD COLUMN id BIGSERIAL PRIMARY KEY")
+        )
+        return
+    # SQLite cannot alter a PK in place; rebuild the table and copy rows.
+    op.execute(sa.text("ALTER TABLE segment RENAME TO segment_old"))
+    op.create_table(
+        "segment",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "transcript_id",
+            sa.String(length=36),
+            sa.ForeignKey("transcript.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("start", sa.Float(), nullable=False),
+        sa.Column("end", sa.Float(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("speaker_id_in_transcript", sa.String(length=64), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=True),
+    )
+    op.execute(
+        sa.text(
+            'INSERT INTO segment (transcript_id, start, "end", text, '
+            "speaker_id_in_transcript, confidence) "
+            'SELECT transcript_id, start, "end", text, '
+            "speaker_id_in_transcript, confidence FROM segment_old "
+            "ORDER BY transcript_id, start"
+        )
+    )
+    op.execute(sa.text("DROP TABLE segment_old"))
+    # The rename carried the indexes to segment_old; rebuild them here.
+    _recreate_segment_indexes()
+
+
+def downgrade() -> None:
+    """Restore a VARCHAR(36) UUID primary key on segment."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(sa.text("ALTER TABLE segment DROP CONSTRAINT segment_pkey"))
+        op.drop_column("segment", "id")
+        op.execute(
+            sa.text(
+                "ALTER TABLE segment ADD COLUMN id uuid PRIMARY KEY "
+                "DEFAULT gen_random_uuid()"
+            )
+        )
+        return
+    op.execute(sa.text("ALTER TABLE segment RENAME TO segment_old"))
+    op.create_table(
+        "segment",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column(
+            "transcript_id",
+            sa.String(length=36),
+            sa.ForeignKey("transcript.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("start", sa.Float(), nullable=False),
+        sa.Column("end", sa.Float(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("speaker_id_in_transcript", sa.String(length=64), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=True),
+    )
+    op.execute(
+        sa.text(
+            'INSERT INTO segment (id, transcript_id, start, "end", text, '
+            "speaker_id_in_transcript, confidence) "
+            "SELECT lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2)))"
+            " || '-4' || substr(lower(hex(randomblob(2))), 2) || '-a'"
+            " || substr(lower(hex(randomblob(2))), 2) || '-'"
+            " || lower(hex(randomblob(6))), "
+            'transcript_id, start, "end", text, '
+            "speaker_id_in_transcript, confidence FROM segment_old"
+        )
+    )
+    op.execute(sa.text("DROP TABLE segment_old"))
+    _recreate_segment_indexes()
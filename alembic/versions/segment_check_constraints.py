@@ -0,0 +1,42 @@
+"""add check constraints on segment times and confidence
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Reject malformed segments (start after end, confidence outside 0..1).
+
+    Older ingest stored a missing `end` as 0.0 and confidence unclamped,
+    so repair existing rows the same way ingest now normalizes them
+    before adding the checks; NULL confidence passes BETWEEN. Uses batch
+    mode so the SQLite table rebuild is handled transparently.
+    """
+    op.execute(sa.text('UPDATE segment SET "end" = start WHERE "end" < start'))
+    op.execute(sa.text("UPDATE segment SET confidence = 0 WHERE confidence < 0"))
+    op.execute(sa.text("UPDATE segment SET confidence = 1 WHERE confidence > 1"))
+    with op.batch_alter_table("segment") as batch:
+        batch.create_check_constraint("ck_segment_time_order", 'start <= "end"')
+        batch.create_check_constraint(
+            "ck_segment_confidence_range", "confidence BETWEEN 0 AND 1"
+        )
+
+
+def downgrade() -> None:
+    """Drop the segment check constraints."""
+    with op.batch_alter_table("segment") as batch:
+        batch.drop_constraint("ck_segment_confidence_range", type_="check")
+        batch.drop_constraint("ck_segment_time_order", type_="check")
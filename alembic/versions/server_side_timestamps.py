@@ -0,0 +1,55 @@
+"""add server-side defaults for created_at and updated_at
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, Sequence[str], None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMP_COLUMNS: list[tuple[str, str]] = [
+    ("content_group", "created_at"),
+    ("content_group", "updated_at"),
+    ("speaker_profile", "created_at"),
+    ("speaker_profile", "updated_at"),
+    ("transcript", "created_at"),
+    ("transcript_llm_analysis", "created_at"),
+]
+
+
+def upgrade() -> None:
+    """Let the database stamp creation timestamps.
+
+    The models now use server_default=func.now() instead of a Python-side
+    datetime.utcnow default, so existing tables need the DDL default or new
+    rows inserted without an explicit value would get NULL.
+    """
+    for table, column in _TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                server_default=sa.func.now(),
+                existing_nullable=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the server-side timestamp defaults."""
+    for table, column in _TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                server_default=None,
+                existing_nullable=True,
+            )
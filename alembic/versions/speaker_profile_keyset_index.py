@@ -0,0 +1,34 @@
+"""add keyset pagination index for speaker profile listings
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Back keyset pagination of speaker listings.
+
+    (surname, first_name, id) matches the listing's ORDER BY, so each page
+    is an index seek instead of an OFFSET scan over skipped rows.
+    """
+    op.create_index(
+        "ix_speaker_profile_name_id",
+        "speaker_profile",
+        ["surname", "first_name", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the speaker listing keyset index."""
+    op.drop_index("ix_speaker_profile_name_id", table_name="speaker_profile")
@@ -0,0 +1,54 @@
+"""convert transcript metadata to jsonb with gin index
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store transcript.metadata as jsonb on Postgres and index it with GIN.
+
+    json is re-parsed text on every read and cannot be indexed; jsonb is
+    binary and supports containment lookups (metadata @> ...) via GIN. On
+    SQLite the column stays plain JSON and the index is an ordinary one,
+    kept only so the schema matches the model metadata.
+    """
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            sa.text(
+                "ALTER TABLE transcript ALTER COLUMN metadata TYPE jsonb "
+                "USING metadata::jsonb"
+            )
+        )
+        op.create_index(
+            "ix_transcript_metadata_gin",
+            "transcript",
+            ["metadata"],
+            postgresql_using="gin",
+        )
+    else:
+        op.create_index("ix_transcript_metadata_gin", "transcript", ["metadata"])
+
+
+def downgrade() -> None:
+    """Revert transcript.metadata to json and drop the index."""
+    op.drop_index("ix_transcript_metadata_gin", table_name="transcript")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            sa.text(
+                "ALTER TABLE transcript ALTER COLUMN metadata TYPE json "
+                "USING metadata::json"
+            )
+        )
@@ -7,20 +7,38 @@ and writes a Netscape-format cookie file suitable for yt-dlp (e.g. YT_COOKIES_FI
 """
 
 import argparse
+import io
 import json
+import re
 import sys
 import time
 from pathlib import Path
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _json_loads = json.loads
+
 NETSCAPE_HEADER = "# Netscape HTTP Cookie File"
+
+# Splits a Cookie header on ';' and eats surrounding whitespace in one pass.
+_COOKIE_SPLIT_RE = re.compile(r"\s*;\s*")
 DEFAULT_DOMAIN = ".youtube.com"
 DEFAULT_PATH = "/"
 DEFAULT_EXPIRY_YEARS = 10
+_DEFAULT_EXPIRY_DELTA = DEFAULT_EXPIRY_YEARS * 365 * 24 * 60 * 60
+
+# Maps TAB and newline characters to spaces in one C-level pass.
+_SANITIZE_TABLE = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+_CONTROL_RE = re.compile(r"[\t\n\r]")
 
 
 def _sanitize(s: str) -> str:
     """Replace TAB and newline in cookie name/value to preserve Netscape format."""
-    return s.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+    # Almost all values are clean; skip the translate allocation for those.
+    return s if _CONTROL_RE.search(s) is None else s.translate(_SANITIZE_TABLE)
 
 
 def _cookie_to_netscape_line(
@@ -34,16 +52,9 @@ def _cookie_to_netscape_line(
     """Format a single cookie as a Netscape line (TAB-separated)."""
     include_subdomains = "TRUE" if domain.startswith(".") else "FALSE"
     secure_str = "TRUE" if secure else "FALSE"
-    return "\t".join(
-        [
-            domain,
-            include_subdomains,
-            path,
-            secure_str,
-            str(int(expiration)),
-            _sanitize(name),
-            _sanitize(value),
-        ]
+    return (
+        f"{domain}\t{include_subdomains}\t{path}\t{secure_str}"
+        f"\t{int(expiration)}\t{_sanitize(name)}\t{_sanitize(value)}"
     )
 
 
@@ -54,16 +65,14 @@ def _parse_json_cookies(data: str) -> list[dict]:
     Accepts array of objects or single object. Chrome-style keys (expirationDate,
     domain, path, secure) are normalized. Missing fields get defaults.
     """
-    raw = json.loads(data)
+    raw = _json_loads(data)
     if isinstance(raw, dict):
         raw = [raw]
     if not isinstance(raw, list):
         raise ValueError("JSON must be an array of cookie objects or a single object")
 
-    default_expiry = int(time.time()) + (
-        DEFAULT_EXPIRY_YEARS * 365 * 24 * 60 * 60
-    )
-    cookies: list[dict] = []
+    default_expiry = int(time.time()) + _DEFAULT_EXPIRY_DELTA
+    cookies: list[dict] = [None] * len(raw)  # pre-sized; filled by index
     for i, obj in enumerate(raw):
         if not isinstance(obj, dict):
             raise ValueError(f"Cookie at index {i} is not an object")
@@ -78,20 +87,17 @@ def _parse_json_cookies(data: str) -> list[dict]:
             raw_exp = obj.get("expires")
         if raw_exp is None:
             expiration = default_expiry
-        elif isinstance(raw_exp, (int, float)) and raw_exp <= 0:
-            expiration = 0  # session cookie
         else:
-            expiration = int(float(raw_exp))
-        cookies.append(
-            {
-                "domain": obj.get("domain") or DEFAULT_DOMAIN,
-                "path": obj.get("path") or DEFAULT_PATH,
-                "secure": bool(obj.get("secure", True)),
-                "expiration": expiration,
-                "name": str(name),
-                "value": str(value),
-            }
-        )
+            exp = float(raw_exp)  # ValueError for junk surfaces as a parse error
+            expiration = 0 if exp <= 0 else int(exp)  # <= 0 means session cookie
+        cookies[i] = {
+            "domain": obj.get("domain") or DEFAULT_DOMAIN,
+            "path": obj.get("path") or DEFAULT_PATH,
+            "secure": bool(obj.get("secure", True)),
+            "expiration": expiration,
+            "name": str(name),
+            "value": str(value),
+        }
     return cookies
 
 
@@ -108,17 +114,12 @@ def _parse_cookie_header(
     meta).
     """
     if default_expiry is None:
-        default_expiry = int(time.time()) + (
-            DEFAULT_EXPIRY_YEARS * 365 * 24 * 60 * 60
-        )
+        default_expiry = int(time.time()) + _DEFAULT_EXPIRY_DELTA
     cookies: list[dict] = []
-    for part in line.split(";"):
-        part = part.strip()
-        if not part:
-            continue
-        if "=" not in part:
+    for part in _COOKIE_SPLIT_RE.split(line):
+        name, eq, value = part.partition("=")
+        if not eq:
             continue
-        name, _, value = part.partition("=")
         name = name.strip()
         value = value.strip()
         if not name:
@@ -138,9 +139,11 @@ def _parse_cookie_header(
 
 def _cookies_to_netscape(cookies: list[dict]) -> str:
     """Convert list of cookie dicts to Netscape format string."""
-    lines = [NETSCAPE_HEADER]
+    buf = io.StringIO()
+    buf.write(NETSCAPE_HEADER)
+    buf.write("\n")
     for c in cookies:
-        lines.append(
+        buf.write(
             _cookie_to_netscape_line(
                 domain=c["domain"],
                 path=c["path"],
@@ -150,7 +153,8 @@ def _cookies_to_netscape(cookies: list[dict]) -> str:
                 value=c["value"],
             )
         )
-    return "\n".join(lines) + "\n"
+        buf.write("\n")
+    return buf.getvalue()
 
 
 def _read_input(path: str | None) -> str:
@@ -215,9 +219,7 @@ def main() -> int:
         else:
             default_expiry = args.expiry
             if default_expiry is None:
-                default_expiry = int(time.time()) + (
-                    DEFAULT_EXPIRY_YEARS * 365 * 24 * 60 * 60
-                )
+                default_expiry = int(time.time()) + _DEFAULT_EXPIRY_DELTA
             cookies = _parse_cookie_header(
                 content,
                 default_domain=args.domain,
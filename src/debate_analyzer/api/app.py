@@ -1,18 +1,26 @@
 """FastAPI application: public and admin API, static files."""
 
+import hashlib
 import os
-from datetime import date
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, AsyncIterator
 
-from fastapi import Depends, FastAPI, HTTPException, status
-from fastapi.responses import FileResponse, Response
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from debate_analyzer.api.auth import get_admin_credentials
 from debate_analyzer.api.loader import (
+    classify_uri,
     load_speaker_stats_parquet,
     load_transcript_payload,
     load_transcript_stats_json,
@@ -25,7 +33,46 @@ from debate_analyzer.api.s3_utils import (
 from debate_analyzer.db import SpeakerProfile, TranscriptRepository, init_db
 from debate_analyzer.db.base import get_db
 
-app = FastAPI(title="Debate Analyzer Web", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """One-time startup work: optionally ensure DB tables, resolve SPA index path.
+
+    Alembic migrations are authoritative for the schema; deploys run
+    `alembic upgrade head`. create_all on boot costs one catalog probe per
+    table per worker, so it is opt-in (DA_AUTO_CREATE_ALL=1) for local dev
+    without migrations. Caching the index path here saves a Path.exists()
+    syscall on every catch-all request.
+    """
+    if os.getenv("DA_AUTO_CREATE_ALL", "0") == "1":
+        init_db()
+    index_path = STATIC_DIR / "index.html"
+    if index_path.exists():
+        # index.html is immutable between deploys: keep the bytes in memory
+        # so the catch-all route does zero disk I/O, and derive a content
+        # ETag so browsers can revalidate with a conditional GET.
+        index_bytes = index_path.read_bytes()
+        app.state.index_bytes = index_bytes
+        digest = hashlib.blake2b(index_bytes, digest_size=8).hexdigest()
+        app.state.index_etag = f'"{digest}"'
+    else:
+        app.state.index_bytes = None
+        app.state.index_etag = None
+    yield
+
+
+# orjson serializes the large dict payloads (transcript segments, stats)
+# several times faster than the stdlib json encoder.
+app = FastAPI(
+    title="Debate Analyzer Web",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Text-heavy JSON (segment lists, stats) compresses ~5-10x; small responses
+# skip compression entirely via minimum_size.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Allowed extension and Content-Type for speaker photo uploads
 SPEAKER_PHOTO_EXT_ALLOWLIST = {"jpg", "jpeg", "png", "webp"}
@@ -41,38 +88,34 @@ SPEAKER_PHOTO_CONTENT_TYPES = {
 SPEAKER_PHOTO_PRESIGNED_GET_EXPIRES_IN = 3600
 
 
-def _speaker_to_dict(profile: SpeakerProfile) -> dict:
-    """Serialize speaker profile to dict and add photo_url from config."""
-    d = profile.to_dict()
+def _photo_url(photo_key: str | None) -> str | None:
+    """Resolve a speaker photo_key to a public or presigned URL, or None."""
     base = os.environ.get("SPEAKER_PHOTOS_BASE_URL", "").strip()
     bucket = os.environ.get("SPEAKER_PHOTOS_S3_BUCKET", "").strip()
-    key_strip = (profile.photo_key or "").strip().lstrip("/")
+    key_strip = (photo_key or "").strip().lstrip("/")
 
     if not key_strip:
-        d["photo_url"] = None
-        return d
-
+        return None
     if base:
         base_rstrip = base.rstrip("/")
-        d["photo_url"] = f"{base_rstrip}/{key_strip}"
-    elif bucket:
+        return f"{base_rstrip}/{key_strip}"
+    if bucket:
         try:
-            d["photo_url"] = generate_presigned_get_url(
+            return generate_presigned_get_url(
                 bucket=bucket,
                 key=key_strip,
                 expires_in=SPEAKER_PHOTO_PRESIGNED_GET_EXPIRES_IN,
             )
         except Exception:
-            d["photo_url"] = None
-    else:
-        d["photo_url"] = None
-    return d
+            return None
+    return None
 
 
-@app.on_event("startup")
-def startup() -> None:
-    """Ensure DB tables exist on startup."""
-    init_db()
+def _speaker_to_dict(profile: SpeakerProfile) -> dict:
+    """Serialize speaker profile to dict and add photo_url from config."""
+    d = profile.to_dict()
+    d["photo_url"] = _photo_url(profile.photo_key)
+    return d
 
 
 def get_repo_from_db(db: Annotated[Session, Depends(get_db)]) -> TranscriptRepository:
@@ -80,6 +123,44 @@ def get_repo_from_db(db: Annotated[Session, Depends(get_db)]) -> TranscriptRepos
     return TranscriptRepository(db)
 
 
+# Short-TTL cache for small, rarely changing public payloads (stat
+# definitions, speaker lists). Per-process and non-PII; admin speaker writes
+# invalidate the speaker entries, stat definitions expire by TTL alone.
+# Bounded LRU (same pattern as s3_utils._PRESIGN_CACHE): keys include the
+# caller-supplied group_id, so an unbounded dict would let clients grow
+# memory by varying the query param.
+_PUBLIC_CACHE: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_PUBLIC_CACHE_MAX = 16
+_PUBLIC_CACHE_TTL_SEC = 60.0
+
+
+def _public_cache_get(key: str) -> Any | None:
+    """Return a cached value if present and fresh, else None."""
+    entry = _PUBLIC_CACHE.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= _PUBLIC_CACHE_TTL_SEC:
+        _PUBLIC_CACHE.pop(key, None)
+        return None
+    _PUBLIC_CACHE.move_to_end(key)
+    return entry[1]
+
+
+def _public_cache_put(key: str, value: Any) -> Any:
+    """Store value under key and return it (for inline use in endpoints)."""
+    _PUBLIC_CACHE[key] = (time.monotonic(), value)
+    _PUBLIC_CACHE.move_to_end(key)
+    while len(_PUBLIC_CACHE) > _PUBLIC_CACHE_MAX:
+        _PUBLIC_CACHE.popitem(last=False)
+    return value
+
+
+def _invalidate_speaker_cache() -> None:
+    """Drop cached speaker lists after an admin write."""
+    for key in [k for k in _PUBLIC_CACHE if k.startswith("speakers:")]:
+        _PUBLIC_CACHE.pop(key, None)
+
+
 # ---------- Public API (no auth) ----------
 
 
@@ -113,6 +194,15 @@ def _default_group_id(repo: TranscriptRepository) -> str | None:
     return g.id if g else None
 
 
+def _is_uuid(value: str) -> bool:
+    """Return True if value parses as a UUID (profile/transcript ids are UUIDs)."""
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
 @app.get("/api/groups/{group_id_or_slug}/speakers")
 def list_speakers_in_group(
     group_id_or_slug: str,
@@ -126,13 +216,12 @@ def list_speakers_in_group(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Group not found"
         )
-    profiles = repo.list_speaker_profiles(group_id=group.id)
-    profile_ids = [p.id for p in profiles]
-    counts = repo.get_transcript_counts_for_speakers(profile_ids)
-    return [
-        {**_speaker_to_dict(p), "transcript_count": counts.get(p.id, 0)}
-        for p in profiles
-    ]
+    rows = repo.list_speaker_profile_rows(group_id=group.id)
+    counts = repo.get_transcript_counts_for_speakers([r["id"] for r in rows])
+    for row in rows:
+        row["photo_url"] = _photo_url(row["photo_key"])
+        row["transcript_count"] = counts.get(row["id"], 0)
+    return rows
 
 
 @app.get("/api/groups/{group_id_or_slug}/transcripts")
@@ -219,7 +308,14 @@ def list_speakers(
     group_id: str | None = None,
 ) -> list[dict]:
     """List speaker profiles (public). Optional group_id to filter by group."""
-    return [_speaker_to_dict(p) for p in repo.list_speaker_profiles(group_id=group_id)]
+    cache_key = f"speakers:{group_id}"
+    cached = _public_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    rows = repo.list_speaker_profile_rows(group_id=group_id)
+    for row in rows:
+        row["photo_url"] = _photo_url(row["photo_key"])
+    return _public_cache_put(cache_key, rows)
 
 
 @app.get("/api/speakers/{id_or_slug}")
@@ -229,13 +325,17 @@ def get_speaker(
     group_id: str | None = None,
 ) -> dict:
     """Get speaker profile and stats by id or slug (public). For slug lookup, group_id or default group is used."""
-    profile = repo.get_speaker_profile_by_id(id_or_slug, group_id=group_id)
-    if not profile and not group_id:
-        default_id = _default_group_id(repo)
-        if default_id:
-            profile = repo.get_speaker_profile_by_slug(id_or_slug, group_id=default_id)
-    if not profile and group_id:
-        profile = repo.get_speaker_profile_by_slug(id_or_slug, group_id=group_id)
+    # Branch on UUID shape so the common slug case issues a single query
+    # instead of an id probe that can never match.
+    profile = None
+    if _is_uuid(id_or_slug):
+        profile = repo.get_speaker_profile_by_id(id_or_slug, group_id=group_id)
+    if not profile:
+        slug_group_id = group_id or _default_group_id(repo)
+        if slug_group_id:
+            profile = repo.get_speaker_profile_by_slug(
+                id_or_slug, group_id=slug_group_id
+            )
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Speaker not found"
@@ -254,7 +354,10 @@ def get_stat_definitions(
     repo: Annotated[TranscriptRepository, Depends(get_repo_from_db)],
 ) -> list[dict]:
     """Return stat groups with stat definitions for grouped UI display (public)."""
-    return repo.get_stat_definitions()
+    cached = _public_cache_get("stat_defs")
+    if cached is not None:
+        return cached
+    return _public_cache_put("stat_defs", repo.get_stat_definitions())
 
 
 # ---------- Admin API (basic auth) ----------
@@ -369,19 +472,52 @@ def admin_delete_group(
 # ----- Admin: Transcripts -----
 
 
+def _decode_transcript_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a '<created_at iso>|<id>' keyset cursor. Raises 400 if malformed."""
+    created_str, sep, transcript_id = cursor.rpartition("|")
+    if sep:
+        try:
+            return datetime.fromisoformat(created_str), transcript_id
+        except ValueError:
+            pass
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+
+
 @app.get("/api/admin/transcripts")
 def admin_list_transcripts(
+    response: Response,
     _: Annotated[object, Depends(get_admin_credentials)],
     repo: Annotated[TranscriptRepository, Depends(get_repo_from_db)],
     limit: int = 100,
     offset: int = 0,
     group_id: str | None = None,
+    cursor: str | None = None,
 ) -> list[dict]:
-    """List transcripts (admin). Optional group_id to filter."""
-    return [
-        t.to_dict()
-        for t in repo.list_transcripts(limit=limit, offset=offset, group_id=group_id)
-    ]
+    """List transcripts (admin). Optional group_id to filter.
+
+    Pagination is keyset-based: pass the X-Next-Cursor response header value
+    back as `cursor` to fetch the next page. `offset` is kept for backward
+    compatibility but scans all skipped rows, unlike the cursor seek.
+    """
+    if cursor:
+        transcripts = repo.list_transcripts_keyset(
+            limit=limit, group_id=group_id, before=_decode_transcript_cursor(cursor)
+        )
+    elif offset:
+        transcripts = repo.list_transcripts(
+            limit=limit, offset=offset, group_id=group_id
+        )
+    else:
+        transcripts = repo.list_transcripts_keyset(limit=limit, group_id=group_id)
+    if transcripts and len(transcripts) == limit:
+        last = transcripts[-1]
+        if last.created_at is not None:
+            response.headers["X-Next-Cursor"] = (
+                f"{last.created_at.isoformat()}|{last.id}"
+            )
+    return [t.to_dict() for t in transcripts]
 
 
 @app.get("/api/admin/transcripts/{transcript_id}")
@@ -391,25 +527,14 @@ def admin_get_transcript(
     repo: Annotated[TranscriptRepository, Depends(get_repo_from_db)],
 ) -> dict:
     """Get transcript with segments and current speaker mappings (admin)."""
-    transcript = repo.get_transcript_by_id(transcript_id)
+    transcript = repo.get_transcript_detail(transcript_id)
     if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
-    mappings = repo.get_mappings_for_transcript(transcript_id)
-    segments = [
-        {
-            "id": s.id,
-            "start": s.start,
-            "end": s.end,
-            "text": s.text,
-            "speaker_id_in_transcript": s.speaker_id_in_transcript,
-            "confidence": s.confidence,
-        }
-        for s in transcript.segments
-    ]
+    segments = list(repo.iter_segment_rows(transcript_id))
     speaker_stats = repo.get_speaker_stats_for_transcript(transcript_id)
     return {
         "transcript": transcript.to_dict(),
-        "mappings": [m.to_dict() for m in mappings],
+        "mappings": [m.to_dict() for m in transcript.speaker_mappings],
         "segments": segments,
         "speaker_stats": speaker_stats,
     }
@@ -445,7 +570,7 @@ def admin_register_transcript(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    source_type = "s3" if body.source_uri.strip().startswith("s3://") else "file"
+    source_type = classify_uri(body.source_uri)[0]
     transcript = repo.create_transcript_from_payload(
         body.source_uri,
         payload,
@@ -686,6 +811,7 @@ def admin_create_speaker(
         short_description=body.short_description,
         photo_key=body.photo_key,
     )
+    _invalidate_speaker_cache()
     return _speaker_to_dict(profile)
 
 
@@ -710,6 +836,7 @@ def admin_update_speaker(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Speaker not found"
         )
+    _invalidate_speaker_cache()
     return _speaker_to_dict(profile)
 
 
@@ -724,6 +851,7 @@ def admin_delete_speaker(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Speaker not found"
         )
+    _invalidate_speaker_cache()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -803,6 +931,19 @@ def admin_save_mappings(
 
 VIDEO_URL_EXPIRES_IN = 3600
 
+# Rotate cached video URL signatures every 15 min, well inside the 1h validity.
+VIDEO_URL_CACHE_BUCKET_SEC = 900
+
+
+@lru_cache(maxsize=1024)
+def _presigned_video_url(bucket: str, key: str, time_bucket: int) -> str:
+    """Presign a video GET URL, cached per (bucket, key) within a time bucket.
+
+    Skips the SigV4 signing pass for repeated requests to the same object;
+    time_bucket forces a fresh signature every VIDEO_URL_CACHE_BUCKET_SEC.
+    """
+    return generate_presigned_get_url(bucket, key, expires_in=VIDEO_URL_EXPIRES_IN)
+
 
 @app.get("/api/admin/transcripts/{transcript_id}/video-url")
 def admin_transcript_video_url(
@@ -842,18 +983,47 @@ def admin_transcript_video_url(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    url = generate_presigned_get_url(bucket, key, expires_in=VIDEO_URL_EXPIRES_IN)
+    url = _presigned_video_url(
+        bucket, key, int(time.time()) // VIDEO_URL_CACHE_BUCKET_SEC
+    )
     return {"url": url, "expires_in": VIDEO_URL_EXPIRES_IN}
 
 
+def _decode_speaker_cursor(cursor: str) -> tuple[str, str, str]:
+    """Decode a '<surname>|<first_name>|<id>' keyset cursor. Raises 400 if malformed."""
+    rest, sep_outer, profile_id = cursor.rpartition("|")
+    surname, sep_inner, first_name = rest.rpartition("|")
+    if sep_outer and sep_inner:
+        return surname, first_name, profile_id
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+
+
 @app.get("/api/admin/speakers")
 def admin_list_speakers(
+    response: Response,
     _: Annotated[object, Depends(get_admin_credentials)],
     repo: Annotated[TranscriptRepository, Depends(get_repo_from_db)],
     group_id: str | None = None,
+    limit: int = 200,
+    cursor: str | None = None,
 ) -> list[dict]:
-    """List speaker profiles (admin). Optional group_id to filter."""
-    return [_speaker_to_dict(p) for p in repo.list_speaker_profiles(group_id=group_id)]
+    """List speaker profiles (admin). Optional group_id to filter.
+
+    Pagination is keyset-based: pass the X-Next-Cursor response header value
+    back as `cursor` to fetch the next page.
+    """
+    after = _decode_speaker_cursor(cursor) if cursor else None
+    rows = repo.list_speaker_profile_rows(limit=limit, group_id=group_id, after=after)
+    for row in rows:
+        row["photo_url"] = _photo_url(row["photo_key"])
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = (
+            f"{last['surname']}|{last['first_name']}|{last['id']}"
+        )
+    return rows
 
 
 # ---------- Static / UI (Vue SPA) ----------
@@ -866,21 +1036,33 @@ if (STATIC_DIR / "assets").exists():
     app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
 
 
+@app.middleware("http")
+async def _asset_cache_headers(request: Request, call_next):
+    """Mark hashed build assets as immutable so browsers never re-fetch them."""
+    response = await call_next(request)
+    if request.url.path.startswith("/assets/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+# First path segments that never resolve to SPA routes (API, docs, assets).
+_RESERVED_TOP_SEGMENTS = frozenset({"api", "docs", "openapi.json", "assets"})
+
+
 @app.get("/{full_path:path}", response_model=None)
-def serve_spa(full_path: str) -> FileResponse | dict:
+def serve_spa(full_path: str, request: Request) -> Response | dict:
     """
     Catch-all: serve index.html for SPA client-side routes.
     Skip paths that belong to API or docs (should not reach here if defined above).
     """
-    if (
-        full_path.startswith("api/")
-        or full_path == "api"
-        or full_path == "docs"
-        or full_path == "openapi.json"
-        or full_path.startswith("assets/")
-    ):
+    if full_path.split("/", 1)[0] in _RESERVED_TOP_SEGMENTS:
         raise HTTPException(status_code=404, detail="Not found")
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path, headers={"Cache-Control": "no-store"})
+    index_bytes = getattr(app.state, "index_bytes", None)
+    if index_bytes is not None:
+        etag = app.state.index_etag
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=0, must-revalidate"}
+        # index.html only changes on deploy: answer conditional GETs with 304.
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=index_bytes, media_type="text/html", headers=headers)
     return {"message": "Debate Analyzer API", "docs": "/docs", "api": "/api/speakers"}
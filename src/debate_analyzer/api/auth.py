@@ -1,5 +1,6 @@
 """HTTP Basic Auth for admin routes."""
 
+import hmac
 import os
 from typing import Annotated
 
@@ -9,6 +10,20 @@ from fastapi.security import HTTPBasic, HTTPBasicCredentials
 security = HTTPBasic()
 
 
+def _admin_credentials_bytes() -> tuple[bytes, bytes] | None:
+    """Read ADMIN_USERNAME/ADMIN_PASSWORD and pre-encode them.
+
+    Returns None when either is unset. Deliberately uncached: two env
+    lookups per request are cheap, and re-reading lets late-injected or
+    rotated credentials take effect without a restart.
+    """
+    username = os.environ.get("ADMIN_USERNAME", "").strip()
+    password = os.environ.get("ADMIN_PASSWORD", "").strip()
+    if not username or not password:
+        return None
+    return username.encode(), password.encode()
+
+
 def get_admin_credentials(
     credentials: Annotated[HTTPBasicCredentials, Depends(security)],
 ) -> HTTPBasicCredentials:
@@ -16,14 +31,17 @@ def get_admin_credentials(
     Verify HTTP Basic credentials against env ADMIN_USERNAME and ADMIN_PASSWORD.
     Raises 401 if missing or invalid.
     """
-    username = os.environ.get("ADMIN_USERNAME", "").strip()
-    password = os.environ.get("ADMIN_PASSWORD", "").strip()
-    if not username or not password:
+    expected = _admin_credentials_bytes()
+    if expected is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Admin auth not configured (ADMIN_USERNAME/ADMIN_PASSWORD)",
         )
-    if credentials.username != username or credentials.password != password:
+    # compare_digest is constant-time; & (not `and`) avoids short-circuiting
+    # on the username so timing does not leak which field was wrong.
+    username_ok = hmac.compare_digest(credentials.username.encode(), expected[0])
+    password_ok = hmac.compare_digest(credentials.password.encode(), expected[1])
+    if not (username_ok & password_ok):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 import boto3  # type: ignore[import-untyped]
+import orjson
 import pyarrow.parquet as pq  # type: ignore[import-untyped]
 
+from debate_analyzer.api.s3_utils import parse_s3_uri
+
+
+@lru_cache(maxsize=1)
+def _s3_client() -> Any:
+    """Process-wide S3 client; bootstrap (credentials, endpoints) is costly."""
+    return boto3.client("s3")
+
+
+def classify_uri(uri: str) -> tuple[str, str]:
+    """Classify a source URI with a single strip and prefix scan.
+
+    Returns ("s3", uri) for s3:// URIs, else ("file", path) with any file://
+    prefix removed. Callers reuse the kind for dispatch and source_type
+    instead of re-running strip/startswith chains.
+    """
+    uri = uri.strip()
+    if uri.startswith("s3://"):
+        return "s3", uri
+    if uri.startswith("file://"):
+        return "file", uri[7:]
+    return "file", uri
+
 
 def load_transcript_payload(source_uri: str) -> dict[str, Any]:
     """
@@ -25,38 +49,26 @@ def load_transcript_payload(source_uri: str) -> dict[str, Any]:
         FileNotFoundError: Local file does not exist.
         ValueError: Unsupported scheme or invalid JSON.
     """
-    source_uri = source_uri.strip()
-    if source_uri.startswith("s3://"):
-        return _load_from_s3(source_uri)
-    if source_uri.startswith("file://"):
-        path = Path(source_uri[7:])
-    else:
-        path = Path(source_uri)
-    return _load_from_file(path)
+    kind, target = classify_uri(source_uri)
+    if kind == "s3":
+        return _load_from_s3(target)
+    return _load_from_file(Path(target))
 
 
 def _load_from_s3(uri: str) -> dict[str, Any]:
     """Parse s3://bucket/key and get object content as JSON."""
-    if not uri.startswith("s3://") or len(uri) < 8:
-        raise ValueError(f"Invalid S3 URI: {uri}")
-    rest = uri[5:]
-    parts = rest.split("/", 1)
-    bucket = parts[0]
-    key = parts[1] if len(parts) > 1 else ""
-    if not key:
-        raise ValueError(f"Invalid S3 key: {uri}")
-    client = boto3.client("s3")
-    response = client.get_object(Bucket=bucket, Key=key)
-    body = response["Body"].read().decode("utf-8")
-    return json.loads(body)
+    bucket, key = parse_s3_uri(uri)
+    response = _s3_client().get_object(Bucket=bucket, Key=key)
+    # orjson takes bytes directly; skips the decode pass and parses ~5x
+    # faster than stdlib json on multi-MB transcripts.
+    return orjson.loads(response["Body"].read())
 
 
 def _load_from_file(path: Path) -> dict[str, Any]:
     """Read JSON from local file."""
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
 def load_transcript_stats_json(source_uri: str) -> dict[str, Any] | None:
@@ -75,42 +87,32 @@ def load_transcript_stats_json(source_uri: str) -> dict[str, Any] | None:
         return None
     stats_uri = source_uri.replace("_transcription.json", "_transcript_stats.json")
     try:
-        if stats_uri.startswith("s3://"):
-            return _load_transcript_stats_from_s3(stats_uri)
-        if stats_uri.startswith("file://"):
-            path = Path(stats_uri[7:])
-        else:
-            path = Path(stats_uri)
-        return _load_transcript_stats_from_file(path)
+        kind, target = classify_uri(stats_uri)
+        if kind == "s3":
+            return _load_transcript_stats_from_s3(target)
+        return _load_transcript_stats_from_file(Path(target))
     except Exception:
         return None
 
 
 def _load_transcript_stats_from_s3(uri: str) -> dict[str, Any] | None:
     """Fetch transcript stats JSON from S3."""
-    if not uri.startswith("s3://") or len(uri) < 8:
-        return None
-    rest = uri[5:]
-    parts = rest.split("/", 1)
-    bucket = parts[0]
-    key = parts[1] if len(parts) > 1 else ""
-    if not key:
+    try:
+        bucket, key = parse_s3_uri(uri)
+    except ValueError:
         return None
-    client = boto3.client("s3")
     try:
-        response = client.get_object(Bucket=bucket, Key=key)
+        response = _s3_client().get_object(Bucket=bucket, Key=key)
     except Exception:
         return None
-    body = response["Body"].read().decode("utf-8")
-    return json.loads(body)
+    return orjson.loads(response["Body"].read())
 
 
 def _load_transcript_stats_from_file(path: Path) -> dict[str, Any] | None:
     """Read transcript stats JSON from local file."""
     if not path.exists():
         return None
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
 def load_speaker_stats_parquet(parquet_uri: str) -> list[dict[str, Any]]:
@@ -128,48 +130,55 @@ def load_speaker_stats_parquet(parquet_uri: str) -> list[dict[str, Any]]:
     Returns:
         List of stat dicts, or empty list if unreadable.
     """
-    parquet_uri = parquet_uri.strip()
     try:
-        if parquet_uri.startswith("s3://"):
-            return _load_speaker_stats_from_s3(parquet_uri)
-        if parquet_uri.startswith("file://"):
-            path = Path(parquet_uri[7:])
-        else:
-            path = Path(parquet_uri)
-        return _load_speaker_stats_from_file(path)
+        kind, target = classify_uri(parquet_uri)
+        if kind == "s3":
+            return _load_speaker_stats_from_s3(target)
+        return _load_speaker_stats_from_file(Path(target))
     except Exception:
         return []
 
 
 def _load_speaker_stats_from_s3(uri: str) -> list[dict[str, Any]]:
     """Fetch parquet from S3 and return list of stat dicts."""
-    if not uri.startswith("s3://") or len(uri) < 8:
-        return []
-    rest = uri[5:]
-    parts = rest.split("/", 1)
-    bucket = parts[0]
-    key = parts[1] if len(parts) > 1 else ""
-    if not key:
+    try:
+        bucket, key = parse_s3_uri(uri)
+    except ValueError:
         return []
-    client = boto3.client("s3")
     try:
-        response = client.get_object(Bucket=bucket, Key=key)
+        response = _s3_client().get_object(Bucket=bucket, Key=key)
     except Exception:
         return []
     body = response["Body"].read()
-    table = pq.read_table(BytesIO(body))
-    return _arrow_table_to_stat_rows(table)
+    return _arrow_table_to_stat_rows(_read_stat_table(BytesIO(body)))
 
 
 def _load_speaker_stats_from_file(path: Path) -> list[dict[str, Any]]:
     """Read parquet from local file and return list of stat dicts."""
     if not path.exists():
         return []
-    table = pq.read_table(path)
-    return _arrow_table_to_stat_rows(table)
+    return _arrow_table_to_stat_rows(_read_stat_table(path))
+
+
+def _read_stat_table(source: Any) -> Any:
+    """Read a stats parquet decoding only the columns the API consumes.
+
+    Pruning with columns= skips I/O and decode for anything else the file
+    carries; use_threads parallelizes column decode.
+    """
+    parquet_file = pq.ParquetFile(source)
+    names = set(parquet_file.schema_arrow.names)
+    wanted = [c for c in _STAT_COLUMNS if c in names]
+    return parquet_file.read(columns=wanted, use_threads=True)
 
 
+# Columns every stats parquet must carry.
+_REQUIRED_STAT_COLUMNS = frozenset(
+    {"speaker_id_in_transcript", "total_seconds", "segment_count", "word_count"}
+)
+
 # Optional extended stat columns (parquet may omit them for backward compat).
+# Tuple, not set: iteration order fixes the key order of produced rows.
 _OPTIONAL_STAT_COLUMNS = (
     "wpm",
     "avg_segment_duration_sec",
@@ -185,44 +194,49 @@ _OPTIONAL_STAT_COLUMNS = (
     "share_words",
 )
 
+_BOOL_STAT_COLUMNS = frozenset({"is_first_speaker", "is_last_speaker"})
+
+# Every column the API consumes, in row key order (required, then optional).
+_STAT_COLUMNS = (
+    "speaker_id_in_transcript",
+    "total_seconds",
+    "segment_count",
+    "word_count",
+) + _OPTIONAL_STAT_COLUMNS
+
 
 def _arrow_table_to_stat_rows(table: Any) -> list[dict[str, Any]]:
     """Convert pyarrow table to list of stat dicts."""
-    if table.num_rows == 0:
+    num_rows = table.num_rows
+    if num_rows == 0:
         return []
-    columns = set(table.column_names)
-    required = {
-        "speaker_id_in_transcript",
-        "total_seconds",
-        "segment_count",
-        "word_count",
-    }
-    if not required.issubset(columns):
+    if not _REQUIRED_STAT_COLUMNS.issubset(table.column_names):
         return []
+    # Convert each column once in Arrow's C++ core instead of boxing one
+    # scalar per cell (rows x columns as_py() calls).
+    data = table.to_pydict()
+    speaker_ids = data["speaker_id_in_transcript"]
+    total_seconds = data["total_seconds"]
+    segment_counts = data["segment_count"]
+    word_counts = data["word_count"]
+    optional_lists = [(col, data.get(col)) for col in _OPTIONAL_STAT_COLUMNS]
     rows: list[dict[str, Any]] = []
-    for i in range(table.num_rows):
+    for i in range(num_rows):
         row: dict[str, Any] = {
-            "speaker_id_in_transcript": table.column("speaker_id_in_transcript")[
-                i
-            ].as_py(),
-            "total_seconds": float(table.column("total_seconds")[i].as_py()),
-            "segment_count": int(table.column("segment_count")[i].as_py()),
-            "word_count": int(table.column("word_count")[i].as_py()),
+            "speaker_id_in_transcript": speaker_ids[i],
+            "total_seconds": float(total_seconds[i]),
+            "segment_count": int(segment_counts[i]),
+            "word_count": int(word_counts[i]),
         }
-        for col in _OPTIONAL_STAT_COLUMNS:
-            if col not in columns:
-                row[col] = None
-                continue
-            val = table.column(col)[i]
-            if val is None or (hasattr(val, "as_py") and val.as_py() is None):
+        for col, values in optional_lists:
+            val = values[i] if values is not None else None
+            if val is None:
                 row[col] = None
-                continue
-            py_val = val.as_py() if hasattr(val, "as_py") else val
-            if col in ("is_first_speaker", "is_last_speaker"):
-                row[col] = bool(py_val)
+            elif col in _BOOL_STAT_COLUMNS:
+                row[col] = bool(val)
             elif col == "turn_count":
-                row[col] = int(py_val) if py_val is not None else None
+                row[col] = int(val)
             else:
-                row[col] = float(py_val) if py_val is not None else None
+                row[col] = float(val)
         rows.append(row)
     return rows
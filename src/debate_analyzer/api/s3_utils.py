@@ -2,6 +2,32 @@
 
 from __future__ import annotations
 
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=1)
+def _s3_client() -> Any:
+    """Process-wide S3 client; creating one walks the credential chain and
+    resolves endpoints, which costs tens of ms per call."""
+    import boto3
+
+    return boto3.client("s3")
+
+
+# GET-presign memo: (bucket, key, expires_in) -> (monotonic ts, url). A URL is
+# reused for the first half of its validity window, so repeated requests for
+# the same object skip the signer. Insertion-ordered for cheap oldest-first
+# eviction; per-process only.
+_PRESIGN_CACHE: OrderedDict[tuple[str, str, int], tuple[float, str]] = OrderedDict()
+_PRESIGN_CACHE_MAX = 1024
+
+# s3://bucket/key with a non-empty key; single compiled scan per parse.
+_S3_URI_RE = re.compile(r"^s3://([^/]+)/(.+)$")
+
 
 def parse_s3_uri(uri: str) -> tuple[str, str]:
     """
@@ -16,16 +42,10 @@ def parse_s3_uri(uri: str) -> tuple[str, str]:
     Raises:
         ValueError: If uri is not a valid S3 URI or key is empty.
     """
-    uri = uri.strip()
-    if not uri.startswith("s3://") or len(uri) < 8:
+    match = _S3_URI_RE.match(uri.strip())
+    if match is None:
         raise ValueError(f"Invalid S3 URI: {uri}")
-    rest = uri[5:]
-    parts = rest.split("/", 1)
-    bucket = parts[0]
-    key = parts[1] if len(parts) > 1 else ""
-    if not key:
-        raise ValueError(f"Invalid S3 key: {uri}")
-    return bucket, key
+    return match.group(1), match.group(2)
 
 
 def generate_presigned_get_url(
@@ -42,16 +62,24 @@ def generate_presigned_get_url(
         expires_in: URL validity in seconds (default 1 hour).
 
     Returns:
-        Presigned URL string.
+        Presigned URL string (possibly cached; still valid for at least
+        expires_in / 2 seconds).
     """
-    import boto3
-
-    client = boto3.client("s3")
-    return client.generate_presigned_url(
+    cache_key = (bucket, key, expires_in)
+    now = time.monotonic()
+    cached = _PRESIGN_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] < expires_in / 2:
+        return cached[1]
+    url = _s3_client().generate_presigned_url(
         "get_object",
         Params={"Bucket": bucket, "Key": key},
         ExpiresIn=expires_in,
     )
+    _PRESIGN_CACHE[cache_key] = (now, url)
+    _PRESIGN_CACHE.move_to_end(cache_key)
+    while len(_PRESIGN_CACHE) > _PRESIGN_CACHE_MAX:
+        _PRESIGN_CACHE.popitem(last=False)
+    return url
 
 
 def generate_presigned_put_url(
@@ -72,13 +100,10 @@ def generate_presigned_put_url(
     Returns:
         Presigned URL string.
     """
-    import boto3
-
-    client = boto3.client("s3")
     params: dict[str, str] = {"Bucket": bucket, "Key": key}
     if content_type:
         params["ContentType"] = content_type
-    return client.generate_presigned_url(
+    return _s3_client().generate_presigned_url(
         "put_object",
         Params=params,
         ExpiresIn=expires_in,
@@ -15,26 +15,62 @@ from __future__ import annotations
 
 import json
 import os
-import statistics
 import sys
-from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 import boto3  # type: ignore[import-untyped]
+import numpy as np
 import pyarrow as pa  # type: ignore[import-untyped]
 import pyarrow.parquet as pq  # type: ignore[import-untyped]
+from botocore.config import Config  # type: ignore[import-untyped]
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _json_loads = json.loads
+
+
+# Per-transcript work is dominated by S3 round trips, so a generous thread
+# pool hides network latency; override via STATS_JOB_WORKERS for small nodes.
+_MAX_WORKERS = int(os.environ.get("STATS_JOB_WORKERS", "32"))
+
+
+@lru_cache(maxsize=1)
+def _s3_client() -> Any:
+    """Process-wide S3 client; bootstrap (credentials, endpoints) is costly.
+
+    The HTTP pool must be at least as large as the thread pool, or workers
+    serialize on botocore's default of 10 connections; adaptive retries
+    back off cleanly on S3 503 SlowDown responses.
+    """
+    return boto3.client(
+        "s3",
+        config=Config(
+            max_pool_connections=max(_MAX_WORKERS, 10),
+            retries={"mode": "adaptive", "max_attempts": 5},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-delimited words (exact, and faster than regex iteration)."""
+    return len(text.split())
 
 
 def _parse_s3_uri(uri: str) -> tuple[str, str]:
     """Return (bucket, key) for an s3:// URI."""
-    if not uri.startswith("s3://") or len(uri) < 8:
+    scheme, sep, rest = uri.partition("://")
+    if scheme != "s3" or not sep or not rest:
         raise ValueError(f"Invalid S3 URI: {uri}")
-    rest = uri[5:]
-    parts = rest.split("/", 1)
-    bucket = parts[0]
-    key = parts[1] if len(parts) > 1 else ""
+    bucket, _, key = rest.partition("/")
     return bucket, key
 
 
@@ -53,85 +89,74 @@ def _compute_speaker_stats(
         List of dicts with speaker_id_in_transcript, total_seconds, segment_count,
         word_count, and extended stats (wpm, turn_count, share_*, etc.).
     """
-    by_speaker: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "total_seconds": 0.0,
-            "segment_count": 0,
-            "word_count": 0,
-            "segment_durations": [],
-            "turn_durations": [],
-        }
+    n = len(transcription)
+    if n == 0:
+        return []
+
+    # Single Python pass to lift the segment fields into contiguous arrays;
+    # everything after runs as vectorized NumPy over those arrays instead of
+    # per-segment dict lookups and float boxing.
+    speakers = [seg.get("speaker") or "SPEAKER_UNKNOWN" for seg in transcription]
+    starts = np.fromiter(
+        (
+            seg.get("start") if seg.get("start") is not None else np.nan
+            for seg in transcription
+        ),
+        dtype=np.float64,
+        count=n,
     )
-    # First pass: aggregate totals and collect segment durations per speaker
-    for seg in transcription:
-        speaker = seg.get("speaker") or "SPEAKER_UNKNOWN"
-        start = seg.get("start")
-        end = seg.get("end")
-        text = seg.get("text") or ""
-        dur = 0.0
-        if start is not None and end is not None:
-            dur = float(end) - float(start)
-            by_speaker[speaker]["total_seconds"] += dur
-        by_speaker[speaker]["segment_durations"].append(dur)
-        by_speaker[speaker]["segment_count"] += 1
-        by_speaker[speaker]["word_count"] += len(text.split())
-
-    # Turn detection: contiguous runs of same speaker (segments are ordered)
-    turn_durations_by_speaker: dict[str, list[float]] = defaultdict(list)
-    if transcription:
-        current_speaker = transcription[0].get("speaker") or "SPEAKER_UNKNOWN"
-        current_start = transcription[0].get("start")
-        current_end = transcription[0].get("end")
-        run_dur = (
-            float(current_end) - float(current_start)
-            if current_start is not None and current_end is not None
-            else 0.0
-        )
-        for seg in transcription[1:]:
-            speaker = seg.get("speaker") or "SPEAKER_UNKNOWN"
-            start = seg.get("start")
-            end = seg.get("end")
-            seg_dur = (
-                float(end) - float(start)
-                if start is not None and end is not None
-                else 0.0
-            )
-            if speaker == current_speaker:
-                run_dur += seg_dur
-                if end is not None:
-                    current_end = end
-            else:
-                turn_durations_by_speaker[current_speaker].append(run_dur)
-                current_speaker = speaker
-                run_dur = seg_dur
-                current_start = start
-                current_end = end
-        turn_durations_by_speaker[current_speaker].append(run_dur)
-
-    total_words = sum(d["word_count"] for d in by_speaker.values())
-    first_speaker = (
-        (transcription[0].get("speaker") or "SPEAKER_UNKNOWN") if transcription else ""
+    ends = np.fromiter(
+        (
+            seg.get("end") if seg.get("end") is not None else np.nan
+            for seg in transcription
+        ),
+        dtype=np.float64,
+        count=n,
     )
-    last_speaker = (
-        (transcription[-1].get("speaker") or "SPEAKER_UNKNOWN") if transcription else ""
+    word_counts = np.fromiter(
+        (_count_words(seg.get("text") or "") for seg in transcription),
+        dtype=np.int64,
+        count=n,
     )
+    durations = ends - starts
+    durations[np.isnan(durations)] = 0.0  # missing start/end counts as zero
+
+    speaker_arr = np.asarray(speakers, dtype=object)
+    uniques, inverse = np.unique(speaker_arr, return_inverse=True)
+    n_speakers = len(uniques)
+    total_seconds = np.bincount(inverse, weights=durations, minlength=n_speakers)
+    segment_counts = np.bincount(inverse, minlength=n_speakers)
+    word_totals = np.bincount(
+        inverse, weights=word_counts, minlength=n_speakers
+    ).astype(np.int64)
+
+    # Turn detection: a run boundary is wherever the speaker id changes
+    # (segments are ordered). reduceat sums each run's durations in C.
+    run_starts = np.flatnonzero(np.r_[True, inverse[1:] != inverse[:-1]])
+    run_durations = np.add.reduceat(durations, run_starts)
+    run_speakers = inverse[run_starts]
+    turn_counts = np.bincount(run_speakers, minlength=n_speakers)
+    shortest_turns = np.full(n_speakers, np.inf)
+    longest_turns = np.full(n_speakers, -np.inf)
+    np.minimum.at(shortest_turns, run_speakers, run_durations)
+    np.maximum.at(longest_turns, run_speakers, run_durations)
+
+    total_words = int(word_totals.sum())
+    first_speaker = speakers[0]
+    last_speaker = speakers[-1]
 
     out: list[dict[str, Any]] = []
-    for speaker, data in sorted(by_speaker.items()):
-        turn_durs = turn_durations_by_speaker.get(speaker) or []
-        turn_count = len(turn_durs) if turn_durs else 1
-        total_sec = data["total_seconds"]
-        seg_count = data["segment_count"]
-        word_count = data["word_count"]
-        seg_durs = data["segment_durations"]
-
-        wpm = (word_count / (total_sec / 60.0)) if total_sec and total_sec > 0 else None
+    for i, speaker in enumerate(uniques):
+        total_sec = float(total_seconds[i])
+        seg_count = int(segment_counts[i])
+        word_count = int(word_totals[i])
+        turn_count = int(turn_counts[i])
+
+        wpm = (word_count / (total_sec / 60.0)) if total_sec > 0 else None
         avg_segment_duration_sec = (total_sec / seg_count) if seg_count else None
-        shortest_talk_sec = min(turn_durs) if turn_durs else None
-        longest_talk_sec = max(turn_durs) if turn_durs else None
-        median_segment_duration_sec = (
-            statistics.median(seg_durs) if len(seg_durs) >= 1 else None
-        )
+        shortest_talk_sec = float(shortest_turns[i])
+        longest_talk_sec = float(longest_turns[i])
+        median_segment_duration_sec = float(np.median(durations[inverse == i]))
         avg_turn_length_sec = (total_sec / turn_count) if turn_count else None
         avg_turn_length_segments = (seg_count / turn_count) if turn_count else None
         share_speaking_time = (
@@ -145,7 +170,7 @@ def _compute_speaker_stats(
 
         out.append(
             {
-                "speaker_id_in_transcript": speaker,
+                "speaker_id_in_transcript": str(speaker),
                 "total_seconds": total_sec,
                 "segment_count": seg_count,
                 "word_count": word_count,
@@ -166,70 +191,36 @@ def _compute_speaker_stats(
     return out
 
 
+# Fixed output schema for the per-speaker stats parquet files.
+_STATS_SCHEMA = pa.schema(
+    [
+        ("speaker_id_in_transcript", pa.string()),
+        ("total_seconds", pa.float64()),
+        ("segment_count", pa.int64()),
+        ("word_count", pa.int64()),
+        ("wpm", pa.float64()),
+        ("avg_segment_duration_sec", pa.float64()),
+        ("shortest_talk_sec", pa.float64()),
+        ("longest_talk_sec", pa.float64()),
+        ("median_segment_duration_sec", pa.float64()),
+        ("turn_count", pa.int64()),
+        ("avg_turn_length_sec", pa.float64()),
+        ("avg_turn_length_segments", pa.float64()),
+        ("is_first_speaker", pa.bool_()),
+        ("is_last_speaker", pa.bool_()),
+        ("share_speaking_time", pa.float64()),
+        ("share_words", pa.float64()),
+    ]
+)
+
+
 def _rows_to_parquet_table(rows: list[dict[str, Any]]) -> pa.Table:
     """Build a pyarrow table from stat rows (shared by S3 and local write)."""
     if not rows:
         return pa.table({})
-    return pa.table(
-        {
-            "speaker_id_in_transcript": [r["speaker_id_in_transcript"] for r in rows],
-            "total_seconds": pa.array(
-                [r["total_seconds"] for r in rows], type=pa.float64()
-            ),
-            "segment_count": pa.array(
-                [r["segment_count"] for r in rows], type=pa.int64()
-            ),
-            "word_count": pa.array([r["word_count"] for r in rows], type=pa.int64()),
-            "wpm": pa.array(
-                [r.get("wpm") for r in rows],
-                type=pa.float64(),
-            ),
-            "avg_segment_duration_sec": pa.array(
-                [r.get("avg_segment_duration_sec") for r in rows],
-                type=pa.float64(),
-            ),
-            "shortest_talk_sec": pa.array(
-                [r.get("shortest_talk_sec") for r in rows],
-                type=pa.float64(),
-            ),
-            "longest_talk_sec": pa.array(
-                [r.get("longest_talk_sec") for r in rows],
-                type=pa.float64(),
-            ),
-            "median_segment_duration_sec": pa.array(
-                [r.get("median_segment_duration_sec") for r in rows],
-                type=pa.float64(),
-            ),
-            "turn_count": pa.array(
-                [r.get("turn_count") for r in rows],
-                type=pa.int64(),
-            ),
-            "avg_turn_length_sec": pa.array(
-                [r.get("avg_turn_length_sec") for r in rows],
-                type=pa.float64(),
-            ),
-            "avg_turn_length_segments": pa.array(
-                [r.get("avg_turn_length_segments") for r in rows],
-                type=pa.float64(),
-            ),
-            "is_first_speaker": pa.array(
-                [r.get("is_first_speaker", False) for r in rows],
-                type=pa.bool_(),
-            ),
-            "is_last_speaker": pa.array(
-                [r.get("is_last_speaker", False) for r in rows],
-                type=pa.bool_(),
-            ),
-            "share_speaking_time": pa.array(
-                [r.get("share_speaking_time") for r in rows],
-                type=pa.float64(),
-            ),
-            "share_words": pa.array(
-                [r.get("share_words") for r in rows],
-                type=pa.float64(),
-            ),
-        }
-    )
+    # One pass over rows against the fixed schema, instead of a separate
+    # list comprehension per column.
+    return pa.Table.from_pylist(rows, schema=_STATS_SCHEMA)
 
 
 def _compute_transcript_stats(
@@ -276,6 +267,18 @@ def _write_transcript_stats_to_s3(
     )
 
 
+# Shared parquet writer settings: ZSTD level 3 compresses better than the
+# default Snappy and decodes faster on modern CPUs; dictionary encoding
+# collapses the repeated speaker labels and statistics enable predicate
+# pushdown for downstream readers.
+_PARQUET_WRITE_KWARGS: dict[str, Any] = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "write_statistics": True,
+}
+
+
 def _write_parquet_to_s3(
     rows: list[dict[str, Any]],
     bucket: str,
@@ -287,9 +290,10 @@ def _write_parquet_to_s3(
         return
     table = _rows_to_parquet_table(rows)
     buf = BytesIO()
-    pq.write_table(table, buf)
+    pq.write_table(table, buf, **_PARQUET_WRITE_KWARGS)
     buf.seek(0)
-    s3_client.put_object(Bucket=bucket, Key=key, Body=buf.getvalue())
+    # Pass the buffer itself; getvalue() would copy the whole parquet body.
+    s3_client.put_object(Bucket=bucket, Key=key, Body=buf)
 
 
 def _write_parquet_to_file(rows: list[dict[str, Any]], path: Path) -> None:
@@ -297,7 +301,7 @@ def _write_parquet_to_file(rows: list[dict[str, Any]], path: Path) -> None:
     if not rows:
         return
     table = _rows_to_parquet_table(rows)
-    pq.write_table(table, path)
+    pq.write_table(table, path, **_PARQUET_WRITE_KWARGS)
 
 
 def _run_s3(prefix: str) -> int:
@@ -313,40 +317,62 @@ def _run_s3(prefix: str) -> int:
     bucket, prefix_key = _parse_s3_uri(prefix)
     if not prefix_key.endswith("/"):
         prefix_key += "/"
-    client = boto3.client("s3")
+    client = _s3_client()
     paginator = client.get_paginator("list_objects_v2")
-    count = 0
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix_key):
-        for obj in page.get("Contents") or []:
-            key = obj["Key"]
-            if not key.endswith("_transcription.json"):
-                continue
-            stem = key.rsplit("/", 1)[-1].replace("_transcription.json", "")
-            try:
-                resp = client.get_object(Bucket=bucket, Key=key)
-                body = resp["Body"].read().decode("utf-8")
-                data = json.loads(body)
-            except Exception as e:
-                print(f"Warning: failed to read {key}: {e}", file=sys.stderr)
-                continue
-            transcription = data.get("transcription") or []
-            duration = data.get("duration")
-            if duration is not None:
-                try:
-                    duration = float(duration)
-                except (TypeError, ValueError):
-                    duration = None
-            rows = _compute_speaker_stats(transcription, transcript_duration=duration)
-            if not rows:
-                continue
-            parquet_key = prefix_key + stem + "_speaker_stats.parquet"
-            _write_parquet_to_s3(rows, bucket, parquet_key, client)
-            stats = _compute_transcript_stats(rows, duration_from_json=duration)
-            stats_key = prefix_key + stem + "_transcript_stats.json"
-            _write_transcript_stats_to_s3(stats, bucket, stats_key, client)
-            count += 1
-            print(f"Wrote {parquet_key}")
-    return count
+    pages = paginator.paginate(Bucket=bucket, Prefix=prefix_key)
+    # Filter the listing inside botocore with a JMESPath expression rather
+    # than touching every object dict in Python.
+    keys = pages.search("Contents[?ends_with(Key, '_transcription.json')].Key")
+    # One task per transcript: download -> compute -> upload. Tasks spend most
+    # of their time in S3 round trips, so they overlap almost perfectly.
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        futures = [
+            pool.submit(_process_s3_key, client, bucket, prefix_key, key)
+            for key in keys
+            if key  # search() yields None for pages with no Contents
+        ]
+        return sum(f.result() for f in as_completed(futures))
+
+
+def _process_s3_key(client: Any, bucket: str, prefix_key: str, key: str) -> int:
+    """Process one transcript key: read JSON, compute stats, write outputs.
+
+    Returns 1 if a parquet file was written, 0 otherwise (bad input, no rows).
+    """
+    stem = key.rsplit("/", 1)[-1].replace("_transcription.json", "")
+    try:
+        resp = client.get_object(Bucket=bucket, Key=key)
+        # Parse the raw bytes: skips the utf-8 decode copy, and orjson (when
+        # present) tokenizes multi-MB transcripts several times faster.
+        data = _json_loads(resp["Body"].read())
+    except Exception as e:
+        print(f"Warning: failed to read {key}: {e}", file=sys.stderr)
+        return 0
+    transcription = data.get("transcription") or []
+    duration = data.get("duration")
+    if duration is not None:
+        try:
+            duration = float(duration)
+        except (TypeError, ValueError):
+            duration = None
+    rows = _compute_speaker_stats(transcription, transcript_duration=duration)
+    if not rows:
+        return 0
+    parquet_key = prefix_key + stem + "_speaker_stats.parquet"
+    _write_parquet_to_s3(rows, bucket, parquet_key, client)
+    stats = _compute_transcript_stats(rows, duration_from_json=duration)
+    stats_key = prefix_key + stem + "_transcript_stats.json"
+    _write_transcript_stats_to_s3(stats, bucket, stats_key, client)
+    print(f"Wrote {parquet_key}")
+    return 1
+
+
+def _iter_transcripts(dir_path: Path) -> Iterator[Path]:
+    """Yield *_transcription.json paths via os.scandir (streams, no stat)."""
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith("_transcription.json"):
+                yield Path(entry.path)
 
 
 def _run_local(dir_path: Path) -> int:
@@ -362,33 +388,41 @@ def _run_local(dir_path: Path) -> int:
     if not dir_path.is_dir():
         print(f"Error: not a directory: {dir_path}", file=sys.stderr)
         return 0
-    count = 0
-    for path in sorted(dir_path.glob("*_transcription.json")):
-        stem = path.stem.replace("_transcription", "")
+    # JSON parse and parquet encode release the GIL in C, so threads help
+    # here too, if less dramatically than for S3.
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        futures = [
+            pool.submit(_process_local_file, dir_path, path)
+            for path in _iter_transcripts(dir_path)
+        ]
+        return sum(f.result() for f in as_completed(futures))
+
+
+def _process_local_file(dir_path: Path, path: Path) -> int:
+    """Process one local transcript JSON; mirrors _process_s3_key."""
+    stem = path.stem.replace("_transcription", "")
+    try:
+        data = _json_loads(path.read_bytes())
+    except Exception as e:
+        print(f"Warning: failed to read {path}: {e}", file=sys.stderr)
+        return 0
+    transcription = data.get("transcription") or []
+    duration = data.get("duration")
+    if duration is not None:
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            print(f"Warning: failed to read {path}: {e}", file=sys.stderr)
-            continue
-        transcription = data.get("transcription") or []
-        duration = data.get("duration")
-        if duration is not None:
-            try:
-                duration = float(duration)
-            except (TypeError, ValueError):
-                duration = None
-        rows = _compute_speaker_stats(transcription, transcript_duration=duration)
-        if not rows:
-            continue
-        out_path = dir_path / f"{stem}_speaker_stats.parquet"
-        _write_parquet_to_file(rows, out_path)
-        stats = _compute_transcript_stats(rows, duration_from_json=duration)
-        stats_path = dir_path / f"{stem}_transcript_stats.json"
-        stats_path.write_text(json.dumps(stats), encoding="utf-8")
-        count += 1
-        print(f"Wrote {out_path}")
-    return count
+            duration = float(duration)
+        except (TypeError, ValueError):
+            duration = None
+    rows = _compute_speaker_stats(transcription, transcript_duration=duration)
+    if not rows:
+        return 0
+    out_path = dir_path / f"{stem}_speaker_stats.parquet"
+    _write_parquet_to_file(rows, out_path)
+    stats = _compute_transcript_stats(rows, duration_from_json=duration)
+    stats_path = dir_path / f"{stem}_transcript_stats.json"
+    stats_path.write_text(json.dumps(stats), encoding="utf-8")
+    print(f"Wrote {out_path}")
+    return 1
 
 
 def run(prefix: str) -> int:
@@ -1,10 +1,12 @@
 """Database engine and session configuration."""
 
 import os
+from functools import lru_cache
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Default: SQLite for local dev; use DATABASE_URL for Postgres (e.g. RDS).
 # Set FORCE_SQLITE=1 to use SQLite even when DATABASE_URL is set (e.g. local dev with RDS in env).
@@ -18,22 +20,63 @@ else:
     DATABASE_URL = _raw.strip()
 
 
+def _set_sqlite_pragmas(dbapi_conn, _record) -> None:
+    """Apply per-connection SQLite PRAGMAs for concurrent web use.
+
+    WAL lets readers proceed while one writer commits, synchronous=NORMAL
+    drops redundant fsyncs (safe under WAL), and busy_timeout waits out the
+    writer lock instead of raising SQLITE_BUSY immediately.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+@lru_cache(maxsize=1)
 def get_engine():
-    """Create SQLAlchemy engine from DATABASE_URL."""
-    connect_args = {}
+    """Process-wide SQLAlchemy engine for DATABASE_URL.
+
+    Cached so every caller shares one engine (and one connection pool)
+    instead of spawning a fresh pool per call. Tests that need a fresh
+    engine can call get_engine.cache_clear().
+    """
+    kwargs = {
+        "echo": os.environ.get("SQL_ECHO", "").lower() in ("1", "true"),
+        # Default compiled-SQL cache is 500; the API's per-endpoint query
+        # variants plus the batch scripts overflow it and recompile.
+        "query_cache_size": 1200,
+    }
     if DATABASE_URL.startswith("sqlite"):
-        connect_args["check_same_thread"] = False
-    return create_engine(
-        DATABASE_URL,
-        connect_args=connect_args,
-        echo=os.environ.get("SQL_ECHO", "").lower() in ("1", "true"),
-    )
+        kwargs["connect_args"] = {"check_same_thread": False}
+        if ":memory:" in DATABASE_URL:
+            # One shared connection, or every checkout sees an empty DB.
+            kwargs["poolclass"] = StaticPool
+    else:
+        # Long-lived Postgres pool: detect stale connections before use and
+        # recycle them before idle timeouts (e.g. RDS/proxies) kill them.
+        kwargs["pool_pre_ping"] = True
+        kwargs["pool_recycle"] = 1800
+    engine = create_engine(DATABASE_URL, **kwargs)
+    if DATABASE_URL.startswith("sqlite"):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
 
 
+@lru_cache(maxsize=1)
 def get_session_factory():
-    """Return a session factory bound to the engine."""
+    """Return the shared session factory bound to the engine.
+
+    expire_on_commit=False keeps loaded attributes usable after commit, so
+    endpoints that commit and then serialize don't re-SELECT every object.
+    """
     engine = get_engine()
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return sessionmaker(
+        autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+    )
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -47,7 +90,11 @@ def get_db() -> Generator[Session, None, None]:
 
 
 def init_db() -> None:
-    """Create all tables. Call after app startup or in migrations."""
+    """Create all tables (local dev / seed scripts).
+
+    Production schemas come from Alembic migrations; the API only calls
+    this when DA_AUTO_CREATE_ALL=1.
+    """
     from debate_analyzer.db.models import Base
 
     engine = get_engine()
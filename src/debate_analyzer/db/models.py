@@ -1,48 +1,101 @@
 """SQLAlchemy models for speaker profiles, transcripts, mappings, and segments."""
 
+from __future__ import annotations
+
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
-    Column,
+    CheckConstraint,
     Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    TypeDecorator,
     UniqueConstraint,
+    func,
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base (2.0 typed-mapping style)."""
 
 
 def _uuid():
     return str(uuid.uuid4())
 
 
+class _PortableUUID(TypeDecorator):
+    """UUID id/fk columns: native 16-byte uuid on Postgres (see the
+    native_uuid_columns migration), dashed VARCHAR(36) on SQLite.
+    Python-side values are always dashed strings either way.
+
+    Postgres raises DataError on any non-uuid bind, which would turn
+    id-or-slug probes (and malformed ids in URLs) into 500s and poison the
+    transaction before a slug fallback can run. Binding NULL instead makes
+    such probes match nothing, like the VARCHAR comparison on SQLite.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "postgresql":
+            return value
+        try:
+            uuid.UUID(str(value))
+        except ValueError:
+            return None
+        return value
+
+
+_UUID_TYPE = _PortableUUID()
+
+
 class Group(Base):
     """Isolated namespace: transcripts and speakers belong to exactly one group."""
 
     __tablename__ = "content_group"
 
-    id = Column(String(36), primary_key=True, default=_uuid)
-    name = Column(String(255), nullable=False)
-    slug = Column(String(255), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(_UUID_TYPE, primary_key=True, default=_uuid)
+    name: Mapped[str] = mapped_column(String(255))
+    slug: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    description: Mapped[str | None] = mapped_column(Text)
+    # Timestamps are stamped by Python (microsecond precision) with a DDL
+    # fallback for raw SQL inserts. SQLite's CURRENT_TIMESTAMP stores
+    # second-resolution strings, which break lexical keyset comparisons
+    # against microsecond cursors (same pattern on every model below).
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=datetime.utcnow,
+    )
 
-    transcripts = relationship(
-        "Transcript", back_populates="group", cascade="all, delete-orphan"
+    transcripts: Mapped[list[Transcript]] = relationship(
+        back_populates="group", cascade="all, delete-orphan"
     )
-    speaker_profiles = relationship(
-        "SpeakerProfile", back_populates="group", cascade="all, delete-orphan"
+    speaker_profiles: Mapped[list[SpeakerProfile]] = relationship(
+        back_populates="group", cascade="all, delete-orphan"
     )
 
     def to_dict(self) -> dict[str, Any]:
@@ -65,31 +118,48 @@ class SpeakerProfile(Base):
         UniqueConstraint("group_id", "slug", name="uq_speaker_profile_group_slug"),
     )
 
-    id = Column(String(36), primary_key=True, default=_uuid)
-    group_id = Column(
-        String(36), ForeignKey("content_group.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[str] = mapped_column(_UUID_TYPE, primary_key=True, default=_uuid)
+    group_id: Mapped[str] = mapped_column(
+        _UUID_TYPE, ForeignKey("content_group.id", ondelete="CASCADE")
+    )
+    first_name: Mapped[str] = mapped_column(String(255))
+    surname: Mapped[str] = mapped_column(String(255))
+    slug: Mapped[str | None] = mapped_column(String(255), index=True)
+    bio: Mapped[str | None] = mapped_column(Text)
+    short_description: Mapped[str | None] = mapped_column(Text)
+    photo_key: Mapped[str | None] = mapped_column(String(512))
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=datetime.utcnow,
+    )
+
+    group: Mapped[Group] = relationship(back_populates="speaker_profiles")
+    mappings: Mapped[list[SpeakerMapping]] = relationship(
+        back_populates="speaker_profile"
     )
-    first_name = Column(String(255), nullable=False)
-    surname = Column(String(255), nullable=False)
-    slug = Column(String(255), nullable=True, index=True)
-    bio = Column(Text, nullable=True)
-    short_description = Column(Text, nullable=True)
-    photo_key = Column(String(512), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    group = relationship("Group", back_populates="speaker_profiles")
-    mappings = relationship("SpeakerMapping", back_populates="speaker_profile")
+
+    @hybrid_property
+    def display_name(self) -> str:
+        """Full name; also usable in SQL filters (WHERE display_name LIKE ...)."""
+        return f"{self.first_name} {self.surname}".strip()
+
+    @display_name.expression
+    def display_name(cls):  # noqa: N805 - SQLAlchemy expression protocol
+        return func.trim(cls.first_name + " " + cls.surname)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for API responses."""
-        display_name = f"{self.first_name} {self.surname}".strip()
         return {
             "id": self.id,
             "group_id": self.group_id,
             "first_name": self.first_name,
             "surname": self.surname,
-            "display_name": display_name,
+            "display_name": self.display_name,
             "slug": self.slug,
             "bio": self.bio,
             "short_description": self.short_description,
@@ -99,39 +169,58 @@ class SpeakerProfile(Base):
         }
 
 
+# Backs keyset pagination of speaker listings (surname, first_name order).
+Index(
+    "ix_speaker_profile_name_id",
+    SpeakerProfile.surname,
+    SpeakerProfile.first_name,
+    SpeakerProfile.id,
+)
+
+
 class Transcript(Base):
     """One transcript (e.g. one S3 object or Batch job output)."""
 
     __tablename__ = "transcript"
+    __table_args__ = (
+        # GIN only applies on Postgres, where jsonb containment queries
+        # (metadata @> ...) can use it; elsewhere this is a plain index.
+        Index("ix_transcript_metadata_gin", "metadata", postgresql_using="gin"),
+    )
 
-    id = Column(String(36), primary_key=True, default=_uuid)
-    group_id = Column(
-        String(36), ForeignKey("content_group.id", ondelete="CASCADE"), nullable=False
+    id: Mapped[str] = mapped_column(_UUID_TYPE, primary_key=True, default=_uuid)
+    group_id: Mapped[str] = mapped_column(
+        _UUID_TYPE, ForeignKey("content_group.id", ondelete="CASCADE")
+    )
+    source_type: Mapped[str] = mapped_column(String(64), default="s3")
+    source_uri: Mapped[str] = mapped_column(String(1024), unique=True, index=True)
+    title: Mapped[str | None] = mapped_column(String(512))
+    description: Mapped[str | None] = mapped_column(Text)
+    debate_date: Mapped[date | None] = mapped_column(Date)
+    duration: Mapped[float | None] = mapped_column(Float)
+    video_path: Mapped[str | None] = mapped_column(String(1024))
+    speakers_count: Mapped[int | None] = mapped_column(Integer)
+    stats_total_words: Mapped[int | None] = mapped_column(Integer)
+    stats_segment_count: Mapped[int | None] = mapped_column(Integer)
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
+    # jsonb on Postgres: pre-parsed binary representation, indexable with GIN.
+    metadata_: Mapped[Any | None] = mapped_column(
+        "metadata",
+        JSON().with_variant(postgresql.JSONB(), "postgresql"),
+        nullable=True,
     )
-    source_type = Column(String(64), nullable=False, default="s3")
-    source_uri = Column(String(1024), nullable=False, unique=True, index=True)
-    title = Column(String(512), nullable=True)
-    description = Column(Text, nullable=True)
-    debate_date = Column(Date, nullable=True)
-    duration = Column(Float, nullable=True)
-    video_path = Column(String(1024), nullable=True)
-    speakers_count = Column(Integer, nullable=True)
-    stats_total_words = Column(Integer, nullable=True)
-    stats_segment_count = Column(Integer, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    metadata_ = Column("metadata", JSON, nullable=True)
-
-    group = relationship("Group", back_populates="transcripts")
-    segments = relationship(
-        "Segment", back_populates="transcript", cascade="all, delete-orphan"
+
+    group: Mapped[Group] = relationship(back_populates="transcripts")
+    segments: Mapped[list[Segment]] = relationship(
+        back_populates="transcript", cascade="all, delete-orphan"
     )
-    speaker_mappings = relationship(
-        "SpeakerMapping", back_populates="transcript", cascade="all, delete-orphan"
+    speaker_mappings: Mapped[list[SpeakerMapping]] = relationship(
+        back_populates="transcript", cascade="all, delete-orphan"
     )
-    speaker_stats = relationship(
-        "TranscriptSpeakerStats",
-        back_populates="transcript",
-        cascade="all, delete-orphan",
+    speaker_stats: Mapped[list[TranscriptSpeakerStats]] = relationship(
+        back_populates="transcript", cascade="all, delete-orphan"
     )
 
     def to_dict(self) -> dict[str, Any]:
@@ -154,6 +243,14 @@ class Transcript(Base):
         }
 
 
+# Backs keyset pagination of transcript listings (newest first).
+Index(
+    "ix_transcript_created_at_id",
+    Transcript.created_at.desc(),
+    Transcript.id,
+)
+
+
 class SpeakerMapping(Base):
     """Maps a transcript's diarization label (e.g. SPEAKER_00) to a speaker profile."""
 
@@ -164,16 +261,21 @@ class SpeakerMapping(Base):
         ),
     )
 
-    transcript_id = Column(
-        String(36), ForeignKey("transcript.id", ondelete="CASCADE"), primary_key=True
+    transcript_id: Mapped[str] = mapped_column(
+        _UUID_TYPE, ForeignKey("transcript.id", ondelete="CASCADE"), primary_key=True
     )
-    speaker_id_in_transcript = Column(String(64), primary_key=True)  # e.g. SPEAKER_00
-    speaker_profile_id = Column(
-        String(36), ForeignKey("speaker_profile.id", ondelete="CASCADE"), nullable=True
+    # e.g. SPEAKER_00
+    speaker_id_in_transcript: Mapped[str] = mapped_column(String(64), primary_key=True)
+    speaker_profile_id: Mapped[str | None] = mapped_column(
+        _UUID_TYPE,
+        ForeignKey("speaker_profile.id", ondelete="CASCADE"),
+        index=True,
     )
 
-    transcript = relationship("Transcript", back_populates="speaker_mappings")
-    speaker_profile = relationship("SpeakerProfile", back_populates="mappings")
+    transcript: Mapped[Transcript] = relationship(back_populates="speaker_mappings")
+    speaker_profile: Mapped[SpeakerProfile | None] = relationship(
+        back_populates="mappings"
+    )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for API responses."""
@@ -188,20 +290,37 @@ class Segment(Base):
     """One segment (start, end, text, speaker). Stored for fast stats."""
 
     __tablename__ = "segment"
+    __table_args__ = (
+        # Per-speaker aggregation and ordered playback both probe by
+        # transcript; without these every lookup scans the segment table.
+        Index("ix_segment_tx_speaker", "transcript_id", "speaker_id_in_transcript"),
+        Index("ix_segment_tx_start", "transcript_id", "start"),
+        # Reject malformed rows at insert so stats never see negative
+        # durations; NULL confidence passes the BETWEEN check.
+        CheckConstraint("start <= \"end\"", name="ck_segment_time_order"),
+        CheckConstraint(
+            "confidence BETWEEN 0 AND 1", name="ck_segment_confidence_range"
+        ),
+    )
 
-    id = Column(String(36), primary_key=True, default=_uuid)
-    transcript_id = Column(
-        String(36),
-        ForeignKey("transcript.id", ondelete="CASCADE"),
-        nullable=False,
+    # Autoincrement surrogate key: segments are only ever addressed through
+    # their transcript, and sequential ints append to the PK B-tree instead
+    # of splitting pages the way random UUIDs do.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
     )
-    start = Column(Float, nullable=False)
-    end = Column(Float, nullable=False)
-    text = Column(Text, nullable=False)
-    speaker_id_in_transcript = Column(String(64), nullable=False)
-    confidence = Column(Float, nullable=True)
+    transcript_id: Mapped[str] = mapped_column(
+        _UUID_TYPE, ForeignKey("transcript.id", ondelete="CASCADE")
+    )
+    start: Mapped[float] = mapped_column(Float)
+    end: Mapped[float] = mapped_column(Float)
+    text: Mapped[str] = mapped_column(Text)
+    speaker_id_in_transcript: Mapped[str] = mapped_column(String(64))
+    confidence: Mapped[float | None] = mapped_column(Float)
 
-    transcript = relationship("Transcript", back_populates="segments")
+    transcript: Mapped[Transcript] = relationship(back_populates="segments")
 
 
 class SpeakerStatGroup(Base):
@@ -209,13 +328,12 @@ class SpeakerStatGroup(Base):
 
     __tablename__ = "speaker_stat_group"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    key = Column(String(64), unique=True, nullable=False, index=True)
-    label = Column(String(255), nullable=False)
-    sort_order = Column(Integer, nullable=False, default=0)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    key: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    label: Mapped[str] = mapped_column(String(255))
+    sort_order: Mapped[int] = mapped_column(Integer, default=0)
 
-    stat_definitions = relationship(
-        "SpeakerStatDefinition",
+    stat_definitions: Mapped[list[SpeakerStatDefinition]] = relationship(
         back_populates="group",
         order_by="SpeakerStatDefinition.sort_order",
     )
@@ -226,54 +344,48 @@ class SpeakerStatDefinition(Base):
 
     __tablename__ = "speaker_stat_definition"
 
-    stat_key = Column(String(64), primary_key=True)
-    group_id = Column(
-        Integer,
-        ForeignKey("speaker_stat_group.id", ondelete="CASCADE"),
-        nullable=False,
+    stat_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    group_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("speaker_stat_group.id", ondelete="CASCADE")
     )
-    label = Column(String(255), nullable=False)
-    sort_order = Column(Integer, nullable=False, default=0)
+    label: Mapped[str] = mapped_column(String(255))
+    sort_order: Mapped[int] = mapped_column(Integer, default=0)
 
-    group = relationship("SpeakerStatGroup", back_populates="stat_definitions")
+    group: Mapped[SpeakerStatGroup] = relationship(back_populates="stat_definitions")
 
 
 class TranscriptSpeakerStats(Base):
     """Per-transcript, per-speaker stats (core + extended: wpm, turns, shares)."""
 
+    # The composite primary key already enforces uniqueness of
+    # (transcript_id, speaker_id_in_transcript); no extra unique constraint.
+    # The pkey cannot serve probes by speaker alone, hence the secondary index.
     __tablename__ = "transcript_speaker_stats"
     __table_args__ = (
-        UniqueConstraint(
-            "transcript_id",
-            "speaker_id_in_transcript",
-            name="uq_transcript_speaker_stats",
-        ),
+        Index("ix_transcript_speaker_stats_speaker", "speaker_id_in_transcript"),
     )
 
-    transcript_id = Column(
-        String(36),
-        ForeignKey("transcript.id", ondelete="CASCADE"),
-        primary_key=True,
-        nullable=False,
+    transcript_id: Mapped[str] = mapped_column(
+        _UUID_TYPE, ForeignKey("transcript.id", ondelete="CASCADE"), primary_key=True
     )
-    speaker_id_in_transcript = Column(String(64), primary_key=True, nullable=False)
-    total_seconds = Column(Float, nullable=False)
-    segment_count = Column(Integer, nullable=False)
-    word_count = Column(Integer, nullable=False)
-    wpm = Column(Float, nullable=True)
-    avg_segment_duration_sec = Column(Float, nullable=True)
-    shortest_talk_sec = Column(Float, nullable=True)
-    longest_talk_sec = Column(Float, nullable=True)
-    median_segment_duration_sec = Column(Float, nullable=True)
-    turn_count = Column(Integer, nullable=True)
-    avg_turn_length_sec = Column(Float, nullable=True)
-    avg_turn_length_segments = Column(Float, nullable=True)
-    is_first_speaker = Column(Boolean, nullable=False, default=False)
-    is_last_speaker = Column(Boolean, nullable=False, default=False)
-    share_speaking_time = Column(Float, nullable=True)
-    share_words = Column(Float, nullable=True)
-
-    transcript = relationship("Transcript", back_populates="speaker_stats")
+    speaker_id_in_transcript: Mapped[str] = mapped_column(String(64), primary_key=True)
+    total_seconds: Mapped[float] = mapped_column(Float)
+    segment_count: Mapped[int] = mapped_column(Integer)
+    word_count: Mapped[int] = mapped_column(Integer)
+    wpm: Mapped[float | None] = mapped_column(Float)
+    avg_segment_duration_sec: Mapped[float | None] = mapped_column(Float)
+    shortest_talk_sec: Mapped[float | None] = mapped_column(Float)
+    longest_talk_sec: Mapped[float | None] = mapped_column(Float)
+    median_segment_duration_sec: Mapped[float | None] = mapped_column(Float)
+    turn_count: Mapped[int | None] = mapped_column(Integer)
+    avg_turn_length_sec: Mapped[float | None] = mapped_column(Float)
+    avg_turn_length_segments: Mapped[float | None] = mapped_column(Float)
+    is_first_speaker: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_last_speaker: Mapped[bool] = mapped_column(Boolean, default=False)
+    share_speaking_time: Mapped[float | None] = mapped_column(Float)
+    share_words: Mapped[float | None] = mapped_column(Float)
+
+    transcript: Mapped[Transcript] = relationship(back_populates="speaker_stats")
 
 
 class TranscriptLLMAnalysis(Base):
@@ -281,21 +393,22 @@ class TranscriptLLMAnalysis(Base):
 
     __tablename__ = "transcript_llm_analysis"
 
-    id = Column(String(36), primary_key=True, default=_uuid)
-    transcript_id = Column(
-        String(36),
+    id: Mapped[str] = mapped_column(_UUID_TYPE, primary_key=True, default=_uuid)
+    transcript_id: Mapped[str] = mapped_column(
+        _UUID_TYPE,
         ForeignKey("transcript.id", ondelete="CASCADE"),
-        nullable=False,
         index=True,
     )
-    model_name = Column(String(255), nullable=False)
-    source = Column(String(64), nullable=False, default="batch")  # batch, api, etc.
-    created_at = Column(DateTime, default=datetime.utcnow)
-    result = Column(
-        JSON, nullable=False
-    )  # speaker_contributions only: list of {id, speaker_id_in_transcript, summary, keywords}
-
-    transcript = relationship("Transcript", backref="llm_analyses")
+    model_name: Mapped[str] = mapped_column(String(255))
+    source: Mapped[str] = mapped_column(String(64), default="batch")  # batch, api, etc.
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
+    # speaker_contributions only: list of
+    # {id, speaker_id_in_transcript, summary, keywords}
+    result: Mapped[Any] = mapped_column(JSON, nullable=False)
+
+    transcript: Mapped[Transcript] = relationship(backref="llm_analyses")
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for API responses."""
@@ -15,6 +15,7 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from debate_analyzer.api.loader import (
@@ -107,104 +108,38 @@ def _seed_stat_definitions_if_empty(session: Session) -> bool:
     session.add(extended)
     session.flush()  # populate group ids for FK relationship
 
-    core_defs: list[SpeakerStatDefinition] = [
-        SpeakerStatDefinition(
-            stat_key="total_seconds",
-            group_id=core.id,
-            label="Speaking time (sec)",
-            sort_order=0,
-        ),
-        SpeakerStatDefinition(
-            stat_key="segment_count",
-            group_id=core.id,
-            label="Segments",
-            sort_order=1,
-        ),
-        SpeakerStatDefinition(
-            stat_key="word_count",
-            group_id=core.id,
-            label="Words",
-            sort_order=2,
-        ),
+    core_defs = [
+        ("total_seconds", "Speaking time (sec)"),
+        ("segment_count", "Segments"),
+        ("word_count", "Words"),
     ]
-
-    extended_defs: list[SpeakerStatDefinition] = [
-        SpeakerStatDefinition(
-            stat_key="wpm",
-            group_id=extended.id,
-            label="Words per minute",
-            sort_order=0,
-        ),
-        SpeakerStatDefinition(
-            stat_key="avg_segment_duration_sec",
-            group_id=extended.id,
-            label="Avg segment duration (sec)",
-            sort_order=1,
-        ),
-        SpeakerStatDefinition(
-            stat_key="shortest_talk_sec",
-            group_id=extended.id,
-            label="Shortest talk (sec)",
-            sort_order=2,
-        ),
-        SpeakerStatDefinition(
-            stat_key="longest_talk_sec",
-            group_id=extended.id,
-            label="Longest talk (sec)",
-            sort_order=3,
-        ),
-        SpeakerStatDefinition(
-            stat_key="median_segment_duration_sec",
-            group_id=extended.id,
-            label="Median segment duration (sec)",
-            sort_order=4,
-        ),
-        SpeakerStatDefinition(
-            stat_key="turn_count",
-            group_id=extended.id,
-            label="Turn count",
-            sort_order=5,
-        ),
-        SpeakerStatDefinition(
-            stat_key="avg_turn_length_sec",
-            group_id=extended.id,
-            label="Avg turn length (sec)",
-            sort_order=6,
-        ),
-        SpeakerStatDefinition(
-            stat_key="avg_turn_length_segments",
-            group_id=extended.id,
-            label="Avg turn length (segments)",
-            sort_order=7,
-        ),
-        SpeakerStatDefinition(
-            stat_key="is_first_speaker",
-            group_id=extended.id,
-            label="First speaker",
-            sort_order=8,
-        ),
-        SpeakerStatDefinition(
-            stat_key="is_last_speaker",
-            group_id=extended.id,
-            label="Last speaker",
-            sort_order=9,
-        ),
-        SpeakerStatDefinition(
-            stat_key="share_speaking_time",
-            group_id=extended.id,
-            label="Share of speaking time",
-            sort_order=10,
-        ),
-        SpeakerStatDefinition(
-            stat_key="share_words",
-            group_id=extended.id,
-            label="Share of words",
-            sort_order=11,
-        ),
+    extended_defs = [
+        ("wpm", "Words per minute"),
+        ("avg_segment_duration_sec", "Avg segment duration (sec)"),
+        ("shortest_talk_sec", "Shortest talk (sec)"),
+        ("longest_talk_sec", "Longest talk (sec)"),
+        ("median_segment_duration_sec", "Median segment duration (sec)"),
+        ("turn_count", "Turn count"),
+        ("avg_turn_length_sec", "Avg turn length (sec)"),
+        ("avg_turn_length_segments", "Avg turn length (segments)"),
+        ("is_first_speaker", "First speaker"),
+        ("is_last_speaker", "Last speaker"),
+        ("share_speaking_time", "Share of speaking time"),
+        ("share_words", "Share of words"),
     ]
 
-    session.add_all(core_defs)
-    session.add_all(extended_defs)
+    # Single parameterized executemany instead of one INSERT per definition.
+    rows = [
+        {
+            "stat_key": stat_key,
+            "group_id": group_id,
+            "label": label,
+            "sort_order": order,
+        }
+        for group_id, defs in ((core.id, core_defs), (extended.id, extended_defs))
+        for order, (stat_key, label) in enumerate(defs)
+    ]
+    session.execute(insert(SpeakerStatDefinition), rows)
     session.commit()
     return True
 
@@ -267,22 +202,25 @@ def upload_local_data_to_db(
     transcript_stats_imported = 0
     llm_analysis_imported = 0
 
+    # One IN query up front instead of one existence SELECT per file.
+    existing_uris = repo.filter_existing_source_uris(
+        f"file://{path.resolve()}" for path in transcription_files
+    )
+
     for path in transcription_files:
         source_uri = f"file://{path.resolve()}"
-        # Skip if transcript already exists.
-        existing = repo.get_transcript_by_source_uri(source_uri)
-        if existing is None:
-            payload = load_transcript_payload(source_uri)
+        payload = load_transcript_payload(source_uri)
+        if source_uri not in existing_uris:
             transcript = repo.create_transcript_from_payload(
                 source_uri=source_uri,
                 payload=payload,
                 source_type="file",
                 group_id=group.id,
+                skip_existence_check=True,
             )
             transcripts_imported += 1
         else:
-            transcript = existing
-            payload = load_transcript_payload(source_uri)
+            transcript = repo.get_transcript_by_source_uri(source_uri)
 
         transcription = payload.get("transcription") or []
         speaker_ids: set[str] = set()